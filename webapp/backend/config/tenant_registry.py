@@ -1,6 +1,7 @@
 import json
 from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from fastapi import HTTPException
 from pydantic import BaseModel
@@ -24,8 +25,24 @@ def load_tenants() -> tuple[TenantConfig, ...]:
     return tuple(TenantConfig(**t) for t in raw)
 
 
+# Indexed views over load_tenants(); reversed so the first entry wins on
+# duplicates, matching the linear scans these replace.
+@lru_cache
+def _tenants_by_id() -> dict[str, TenantConfig]:
+    return {t.id: t for t in reversed(load_tenants())}
+
+
+@lru_cache
+def _tenants_by_prefix() -> dict[str, TenantConfig]:
+    return {t.storage_prefix: t for t in reversed(load_tenants())}
+
+
 def get_tenant(tenant_id: str) -> TenantConfig:
-    for t in load_tenants():
-        if t.id == tenant_id:
-            return t
-    raise HTTPException(status_code=404, detail=f"Tenant '{tenant_id}' not found")
+    tenant = _tenants_by_id().get(tenant_id)
+    if tenant is None:
+        raise HTTPException(status_code=404, detail=f"Tenant '{tenant_id}' not found")
+    return tenant
+
+
+def find_tenant_by_prefix(storage_prefix: str) -> Optional[TenantConfig]:
+    return _tenants_by_prefix().get(storage_prefix)
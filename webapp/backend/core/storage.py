@@ -7,6 +7,7 @@ Provides a unified interface for reading/writing files regardless of storage bac
 import io
 import os
 import tempfile
+import threading
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from pathlib import Path
@@ -26,6 +27,11 @@ class StorageBackend(ABC):
         """Read binary content from storage."""
         pass
 
+    @abstractmethod
+    def try_read_bytes(self, key: str) -> Optional[bytes]:
+        """Read binary content, or None if the key doesn't exist (one round-trip)."""
+        pass
+
     @abstractmethod
     def write_text(self, key: str, content: str, encoding: str = "utf-8") -> None:
         """Write text content to storage."""
@@ -41,6 +47,14 @@ class StorageBackend(ABC):
         """Check if a key exists in storage."""
         pass
 
+    @abstractmethod
+    def version(self, key: str) -> Optional[str]:
+        """
+        Get an opaque version token for a key (mtime for local, ETag for S3).
+        Returns None if the key does not exist. Changes whenever the content is rewritten.
+        """
+        pass
+
     @abstractmethod
     def list_keys(self, prefix: str = "") -> list[str]:
         """List all keys with the given prefix."""
@@ -98,21 +112,44 @@ class LocalStorageBackend(StorageBackend):
         with open(path, "rb") as f:
             return f.read()
 
-    def write_text(self, key: str, content: str, encoding: str = "utf-8") -> None:
+    def try_read_bytes(self, key: str) -> Optional[bytes]:
+        try:
+            return self.read_bytes(key)
+        except FileNotFoundError:
+            return None
+
+    def _write_atomic(self, key: str, content: bytes) -> None:
+        """
+        Write to a sibling temp file, then rename over the target.
+        Readers never see a half-written file (matches S3 PUT semantics).
+        """
         path = self._resolve(key)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding=encoding) as f:
-            f.write(content)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def write_text(self, key: str, content: str, encoding: str = "utf-8") -> None:
+        self._write_atomic(key, content.encode(encoding))
 
     def write_bytes(self, key: str, content: bytes) -> None:
-        path = self._resolve(key)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "wb") as f:
-            f.write(content)
+        self._write_atomic(key, content)
 
     def exists(self, key: str) -> bool:
         return self._resolve(key).exists()
 
+    def version(self, key: str) -> Optional[str]:
+        try:
+            st = self._resolve(key).stat()
+        except FileNotFoundError:
+            return None
+        return f"{st.st_mtime_ns}-{st.st_size}"
+
     def list_keys(self, prefix: str = "") -> list[str]:
         base = self._resolve(prefix)
         if not base.exists():
@@ -182,6 +219,14 @@ class S3StorageBackend(StorageBackend):
         response = self.client.get_object(Bucket=self.bucket, Key=self._full_key(key))
         return response["Body"].read()
 
+    def try_read_bytes(self, key: str) -> Optional[bytes]:
+        try:
+            return self.read_bytes(key)
+        except self.client.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                return None
+            raise
+
     def write_text(self, key: str, content: str, encoding: str = "utf-8") -> None:
         self.write_bytes(key, content.encode(encoding))
 
@@ -201,6 +246,15 @@ class S3StorageBackend(StorageBackend):
                 return False
             raise
 
+    def version(self, key: str) -> Optional[str]:
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=self._full_key(key))
+        except self.client.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] == "404":
+                return None
+            raise
+        return response["ETag"]
+
     def list_keys(self, prefix: str = "") -> list[str]:
         full_prefix = self._full_key(prefix) if prefix else self.prefix
         if full_prefix and not full_prefix.endswith("/"):
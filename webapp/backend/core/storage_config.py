@@ -20,9 +20,11 @@ Multi-tenant support:
 """
 
 import os
-from contextvars import ContextVar
+from concurrent.futures import Executor
+from contextvars import ContextVar, copy_context
 from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
 
 from .storage import LocalStorageBackend, S3StorageBackend, StorageBackend
 
@@ -61,6 +63,21 @@ def get_credentials_dir() -> str:
     return _credentials_dir.get()
 
 
+def map_in_tenant_context(executor: Executor, fn, *iterables) -> Iterator:
+    """
+    executor.map that runs every call in its own copy of the caller's context.
+
+    Pool threads don't inherit ContextVars (tenant prefix, credentials dir), and
+    one Context can't be entered by two threads at once — hence a copy per call.
+    """
+    base_ctx = copy_context()
+
+    def call(*args):
+        return base_ctx.copy().run(fn, *args)
+
+    return executor.map(call, *iterables)
+
+
 def is_dev_mode() -> bool:
     """
     Check if running in development mode.
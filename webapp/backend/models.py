@@ -1,8 +1,13 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, Any
 from datetime import datetime
 
 
+# Worker threads in the scheduler's pipeline pool; also the cap on
+# max_parallel_runs, since each concurrent run holds one worker throughout
+PIPELINE_MAX_WORKERS = 8
+
+
 class TenantInfo(BaseModel):
     id: str
     display_name: str
@@ -120,6 +125,7 @@ class SchedulerConfig(BaseModel):
     generation_time: str = "10:00"
     publish_time: str = "evening"
     runs: list[ScheduledRunConfig] = []  # Per-run configurations
+    max_parallel_runs: int = Field(2, ge=1, le=PIPELINE_MAX_WORKERS)  # Runs generated concurrently per scheduled job
 
 
 class SchedulerState(BaseModel):
@@ -3,11 +3,11 @@ Analytics routes for YouTube video statistics.
 """
 
 import asyncio
-import json
 import re
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 
 from ..config.tenant_registry import TenantConfig
@@ -33,9 +33,10 @@ def parse_run_timestamp(run_id: str) -> Optional[datetime]:
 def _read_json_file(run_storage, key: str) -> Optional[dict]:
     """Read and parse a JSON file from storage."""
     try:
-        if run_storage.exists(key):
-            return json.loads(run_storage.read_text(key))
-    except (json.JSONDecodeError, Exception):
+        content = run_storage.try_read_bytes(key)
+        if content is not None:
+            return orjson.loads(content)
+    except Exception:
         pass
     return None
 
@@ -223,7 +224,7 @@ async def refresh_run_stats(run_id: str, _: TenantConfig = Depends(storage_dep))
 
 async def _refresh_all_stats(days: int = 30):
     """Background task to refresh stats for all eligible runs."""
-    from ..services.youtube_analytics import get_or_fetch_stats
+    from ..services.youtube_analytics import get_or_fetch_stats_bulk
 
     output_storage = get_output_storage()
 
@@ -245,20 +246,23 @@ async def _refresh_all_stats(days: int = 30):
                     if run_storage.exists("yt_upload.json"):
                         run_ids_with_yt.add(entry.name)
 
-    sem = asyncio.Semaphore(5)
-
-    async def _refresh_one(run_id: str):
+    async def _is_eligible(run_id: str) -> bool:
         run_storage = get_run_storage(run_id)
         yt_upload = await asyncio.to_thread(_read_json_file, run_storage, "yt_upload.json")
-        if yt_upload and _is_older_than_48_hours(yt_upload.get("publish_at")):
-            async with sem:
-                try:
-                    await asyncio.to_thread(get_or_fetch_stats, run_id, True)
-                    logger.info("Refreshed stats for run %s", run_id)
-                except Exception as e:
-                    logger.error("Failed to refresh stats for run %s: %s", run_id, e)
-
-    await asyncio.gather(*[_refresh_one(run_id) for run_id in run_ids_with_yt])
+        return bool(yt_upload) and _is_older_than_48_hours(yt_upload.get("publish_at"))
+
+    run_ids = sorted(run_ids_with_yt)
+    flags = await asyncio.gather(*[_is_eligible(run_id) for run_id in run_ids])
+    eligible = [run_id for run_id, ok in zip(run_ids, flags) if ok]
+    if not eligible:
+        return
+
+    # One batched Analytics query per 200 videos instead of one per run
+    try:
+        updated = await asyncio.to_thread(get_or_fetch_stats_bulk, eligible, True)
+        logger.info("Refreshed stats for %d/%d runs", len(updated), len(eligible))
+    except Exception as e:
+        logger.error("Failed to refresh stats for %d runs: %s", len(eligible), e)
 
 
 @router.post("/refresh-all")
@@ -3,13 +3,13 @@ Scheduler routes - API endpoints for per-tenant scheduler management.
 """
 
 from fastapi import APIRouter, BackgroundTasks, Depends
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 
 from ..config.tenant_registry import TenantConfig
 from ..dependencies import storage_dep
 from ..services import scheduler as scheduler_service
-from ..models import SchedulerConfig, SchedulerStatus, ScheduledRunConfig
+from ..models import PIPELINE_MAX_WORKERS, SchedulerConfig, SchedulerStatus, ScheduledRunConfig
 
 router = APIRouter(tags=["scheduler"])
 
@@ -20,6 +20,7 @@ class SchedulerConfigUpdate(BaseModel):
     generation_time: Optional[str] = None
     publish_time: Optional[str] = None
     runs: Optional[list[ScheduledRunConfig]] = None  # Per-run configurations
+    max_parallel_runs: Optional[int] = Field(None, ge=1, le=PIPELINE_MAX_WORKERS)
 
 
 class TriggerResponse(BaseModel):
@@ -37,13 +38,13 @@ async def get_scheduler_status(tenant: TenantConfig = Depends(storage_dep)):
 @router.post("/enable", response_model=SchedulerConfig)
 async def enable_scheduler(tenant: TenantConfig = Depends(storage_dep)):
     """Enable the scheduler for this tenant."""
-    return scheduler_service.enable_tenant_scheduler(tenant)
+    return await scheduler_service.enable_tenant_scheduler(tenant)
 
 
 @router.post("/disable", response_model=SchedulerConfig)
 async def disable_scheduler(tenant: TenantConfig = Depends(storage_dep)):
     """Disable the scheduler for this tenant."""
-    return scheduler_service.disable_tenant_scheduler(tenant)
+    return await scheduler_service.disable_tenant_scheduler(tenant)
 
 
 @router.get("/config", response_model=SchedulerConfig)
@@ -56,7 +57,7 @@ async def get_config(tenant: TenantConfig = Depends(storage_dep)):
 @router.put("/config", response_model=SchedulerConfig)
 async def update_config(updates: SchedulerConfigUpdate, tenant: TenantConfig = Depends(storage_dep)):
     """Update scheduler configuration for this tenant."""
-    return scheduler_service.update_tenant_scheduler_config(tenant, updates.model_dump(exclude_none=True))
+    return await scheduler_service.update_tenant_scheduler_config(tenant, updates.model_dump(exclude_none=True))
 
 
 @router.post("/trigger", response_model=TriggerResponse)
@@ -6,6 +6,7 @@ ranks them by a composite performance score, and uses an LLM
 to generate actionable improvement suggestions for the news-selection prompt.
 """
 
+import heapq
 import json
 from collections import defaultdict
 
@@ -152,14 +153,13 @@ def generate_news_selection_review(limit: int = 60) -> dict:
             "experiment_ideas": [],
         }
 
-    # Score and sort
+    # Score once, then partial-sort only the top/bottom slices we need
     scored = [(run, _score_run(run["yt_stats"])) for run in runs]
-    scored.sort(key=lambda x: x[1], reverse=True)
 
     top_n = min(10, len(scored))
     bottom_n = min(10, len(scored))
-    top_runs = scored[:top_n]
-    bottom_runs = scored[-bottom_n:]
+    top_runs = heapq.nlargest(top_n, scored, key=lambda x: x[1])
+    bottom_runs = heapq.nsmallest(bottom_n, scored, key=lambda x: x[1])[::-1]
 
     # Category breakdown
     category_breakdown = _format_category_breakdown(scored)
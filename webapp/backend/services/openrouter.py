@@ -8,8 +8,9 @@ since OpenRouter does not support those API endpoints.
 """
 
 import os
+from functools import lru_cache
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 # ── Per-task model constants ────────────────────────────────────────────────
 # Pass model= explicitly to any generation function to override these.
@@ -62,24 +63,46 @@ PROMPT_REVIEW = "google/gemini-2.5-pro"
 PERPLEXITY_SEARCH = "perplexity/sonar-pro"
 
 
-def get_chat_client() -> OpenAI:
-    """Return an OpenAI-compatible client pointed at OpenRouter.
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+OPENROUTER_HEADERS = {
+    "HTTP-Referer": "https://github.com/yt-centric-generator",
+    "X-Title": "YT Centric Generator",
+}
 
-    Used for all chat completion tasks (dialogue, image prompts, metadata,
-    news selection). DALL-E and Whisper must use get_openai_client() instead.
-    """
+
+def _get_openrouter_api_key() -> str:
     api_key = os.environ.get("OPENROUTER_API_KEY")
     if not api_key:
         raise EnvironmentError(
             "OPENROUTER_API_KEY is not set. Get your key at https://openrouter.ai/keys"
         )
+    return api_key
+
+
+@lru_cache(maxsize=1)
+def get_chat_client() -> OpenAI:
+    """Return an OpenAI-compatible client pointed at OpenRouter.
+
+    Used for all chat completion tasks (dialogue, image prompts, metadata,
+    news selection). DALL-E and Whisper must use get_openai_client() instead.
+
+    The client is created once and shared, so its HTTP connection pool
+    (keep-alive, TLS sessions) is reused across calls and threads.
+    """
     return OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key,
-        default_headers={
-            "HTTP-Referer": "https://github.com/yt-centric-generator",
-            "X-Title": "YT Centric Generator",
-        },
+        base_url=OPENROUTER_BASE_URL,
+        api_key=_get_openrouter_api_key(),
+        default_headers=OPENROUTER_HEADERS,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_chat_client() -> AsyncOpenAI:
+    """Async counterpart of get_chat_client() for callers running on the event loop."""
+    return AsyncOpenAI(
+        base_url=OPENROUTER_BASE_URL,
+        api_key=_get_openrouter_api_key(),
+        default_headers=OPENROUTER_HEADERS,
     )
 
 
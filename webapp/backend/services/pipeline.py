@@ -6,7 +6,8 @@ Each step is isolated and can be called independently.
 import json
 import subprocess
 import sys
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
@@ -37,6 +38,32 @@ def _get_seeds_dir() -> Path:
 
 logger = get_logger(__name__)
 
+# Per-tenant lock around render/metadata/upload — the episode number is read
+# at render time and only bumped after upload, so those steps can't overlap.
+_publish_locks: dict[str, threading.Lock] = {}
+_publish_locks_guard = threading.Lock()
+
+
+def _get_publish_lock(tenant_prefix: str) -> threading.Lock:
+    with _publish_locks_guard:
+        return _publish_locks.setdefault(tenant_prefix, threading.Lock())
+
+# Run IDs have one-second resolution (routes parse them back as timestamps),
+# so runs created within the same second — e.g. the scheduler's parallel runs —
+# are handed the next free second instead of sharing a directory.
+_run_id_lock = threading.Lock()
+_last_run_ts: Optional[datetime] = None
+
+
+def _next_run_timestamp() -> datetime:
+    global _last_run_ts
+    with _run_id_lock:
+        ts = datetime.now().replace(microsecond=0)
+        if _last_run_ts is not None and ts <= _last_run_ts:
+            ts = _last_run_ts + timedelta(seconds=1)
+        _last_run_ts = ts
+        return ts
+
 # Import settings and prompts services
 from . import settings as settings_service
 from . import prompts as prompts_service
@@ -227,7 +254,7 @@ def create_run_dir() -> tuple[str, Path]:
     Returns:
         Tuple of (run_id, run_dir_path). run_dir is None for S3.
     """
-    run_id = f"run_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}"
+    run_id = f"run_{_next_run_timestamp().strftime('%Y-%m-%d_%H-%M-%S')}"
 
     if is_s3_enabled():
         # For S3, just return the run_id - no local directory needed
@@ -236,7 +263,8 @@ def create_run_dir() -> tuple[str, Path]:
     else:
         ensure_storage_dirs()
         run_dir = _get_output_dir() / run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
+        # exist_ok=False: never hand out a directory another run already owns
+        run_dir.mkdir(parents=True, exist_ok=False)
         logger.info("Created run directory: %s", run_dir)
         return run_id, run_dir
 
@@ -260,6 +288,9 @@ def create_seed(
     """
     run_id, run_dir = create_run_dir()
     run_storage = get_run_storage(run_id)
+    if run_storage.exists("seed.json"):
+        # Never overwrite another run's seed (S3 has no mkdir to fail on)
+        raise RuntimeError(f"Run {run_id} already exists")
 
     # Create seed data with optional metadata
     seed_data = {"news_seed": news_text}
@@ -646,9 +677,8 @@ def upload_to_youtube_for_run(run_id: str, schedule_option: str = "auto") -> dic
     current_episode = settings_service.get_episode_number()
 
     # Resolve tenant timezone from tenant registry (authoritative source)
-    from ..config.tenant_registry import load_tenants as _load_tenants
-    prefix = get_tenant_prefix()
-    _tenant = next((t for t in _load_tenants() if t.storage_prefix == prefix), None)
+    from ..config.tenant_registry import find_tenant_by_prefix
+    _tenant = find_tenant_by_prefix(get_tenant_prefix())
     timezone_str = _tenant.timezone if _tenant else "Europe/Warsaw"
 
     # Do the upload
@@ -676,6 +706,9 @@ def upload_to_youtube_for_run(run_id: str, schedule_option: str = "auto") -> dic
     upload_json = json.dumps(upload_info, ensure_ascii=False, indent=2)
     run_storage.write_text(keys["yt_upload"], upload_json)
 
+    from .youtube_analytics import forget_missing_upload
+    forget_missing_upload(run_id)
+
     logger.info("YouTube upload complete: %s (episode %d)", upload_info["url"], current_episode)
     return upload_info
 
@@ -738,6 +771,33 @@ def fast_upload_for_run(
     return upload_to_youtube_for_run(run_id, schedule_option=schedule_option)
 
 
+def run_full_pipeline(run_id: str, publish_time: str, language: str = "pl") -> None:
+    """
+    Run every generation step for a freshly seeded run and upload to YouTube.
+
+    Steps: dialogue → audio → images → video → yt_metadata → youtube upload.
+    Blocking; meant to be called from a single worker thread per run.
+    """
+    logger.info("[%s] Generating dialogue...", run_id)
+    generate_dialogue_for_run(run_id)
+
+    logger.info("[%s] Generating audio...", run_id)
+    generate_audio_for_run(run_id, language=language)
+
+    logger.info("[%s] Generating images...", run_id)
+    generate_images_for_run(run_id)
+
+    with _get_publish_lock(get_tenant_prefix()):
+        logger.info("[%s] Generating video...", run_id)
+        generate_video_for_run(run_id)
+
+        logger.info("[%s] Generating YouTube metadata...", run_id)
+        generate_yt_metadata_for_run(run_id)
+
+        logger.info("[%s] Uploading to YouTube (schedule: %s)...", run_id, publish_time)
+        upload_to_youtube_for_run(run_id, schedule_option=publish_time)
+
+
 def delete_youtube_for_run(run_id: str) -> dict:
     """Delete video from YouTube and remove yt_upload.json."""
     logger.info("Deleting YouTube video for run: %s", run_id)
@@ -14,7 +14,7 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
-from ..core.storage_config import get_data_storage
+from ..core.storage_config import get_data_storage, get_tenant_prefix
 
 # Prompt types
 PromptType = Literal["dialogue", "image", "research", "yt-metadata", "news-selection"]
@@ -57,6 +57,13 @@ class ActiveConfig(BaseModel):
     active: str  # prompt id
 
 
+# Active prompt per (tenant prefix, type), tagged with the storage versions of
+# the files it was read from: (stamp, active_id, prompt).
+_active_prompt_cache: dict[
+    tuple[str, PromptType], tuple[tuple, str | None, "PromptContent | None"]
+] = {}
+
+
 def _get_prompts_prefix(prompt_type: PromptType) -> str:
     """Get S3 prefix for prompt type."""
     return f"prompts/{prompt_type}"
@@ -393,6 +400,38 @@ def delete_prompt(prompt_type: PromptType, prompt_id: str) -> bool:
     return True
 
 
+def get_active_prompt(prompt_type: PromptType) -> PromptContent | None:
+    """
+    Get the active prompt for a type, re-reading it only when its files change.
+
+    Checks storage versions (mtime/ETag) of active.json and the prompt's files
+    instead of reading them; the returned object is shared — treat as read-only.
+    """
+    storage = get_data_storage()
+    cache_key = (get_tenant_prefix(), prompt_type)
+    cached = _active_prompt_cache.get(cache_key)
+
+    active_version = storage.version(_get_active_key(prompt_type))
+    if cached and cached[0][0] == active_version:
+        active_id = cached[1]
+    else:
+        active_id = get_active_prompt_id(prompt_type)
+
+    stamp: tuple = (active_version,)
+    if active_id:
+        keys = [_get_prompt_key(prompt_type, active_id), _get_config_key(prompt_type, active_id)]
+        if prompt_type == "dialogue":
+            keys += [_get_step2_key(active_id), _get_step3_key(active_id)]
+        stamp += tuple(storage.version(key) for key in keys)
+
+    if cached and cached[0] == stamp:
+        return cached[2]
+
+    prompt = get_prompt(prompt_type, active_id) if active_id else None
+    _active_prompt_cache[cache_key] = (stamp, active_id, prompt)
+    return prompt
+
+
 def get_active_prompt_content(prompt_type: PromptType) -> str | None:
     """Get the content of the active prompt for a type."""
     active_id = get_active_prompt_id(prompt_type)
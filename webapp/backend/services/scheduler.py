@@ -5,35 +5,130 @@ One APScheduler job per tenant: generate_pl, generate_us, etc.
 """
 
 import asyncio
-import json
+import contextvars
+import functools
+import heapq
+import math
 import random
-from datetime import datetime
-from pathlib import Path
-from typing import Literal, Optional
-
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Collection, Iterable, Literal, Optional
+from zoneinfo import ZoneInfo
+
+import orjson
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PrivateAttr
 
 from ..core.logging_config import get_logger
-from ..core.storage_config import get_config_storage, get_data_storage, set_tenant_prefix, set_credentials_dir
-
-from . import settings as settings_service
-from . import pipeline
+from ..core.storage_config import (
+    get_config_storage,
+    get_run_storage,
+    get_tenant_prefix,
+    map_in_tenant_context,
+    set_credentials_dir,
+    set_tenant_prefix,
+)
+
+# pipeline and youtube_analytics pull in the generation/Google API stacks —
+# they are imported lazily inside the functions that need them.
 from . import prompts as prompts_service
-from . import youtube_analytics
 from .news_source import get_news_source
+from .openrouter import NEWS_SELECTION, get_async_chat_client
 
-from ..config.tenant_registry import TenantConfig, load_tenants
+from ..config.tenant_registry import TenantConfig
+from ..models import PIPELINE_MAX_WORKERS
 
 logger = get_logger(__name__)
 
-# State file location
+# Config/state file locations (tenant config storage)
+SCHEDULER_CONFIG_KEY = "scheduler_config.json"
 SCHEDULER_STATE_KEY = "scheduler_state.json"
 
 # Selection modes
 SelectionMode = Literal["random", "llm"]
 
+# generation_time format: HH:MM (24h)
+_TIME_RE = re.compile(r"^([01]?\d|2[0-3]):([0-5]\d)$")
+
+# Structured-output schema for the news-selection LLM call
+_NEWS_SELECTION_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "news_selection",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "patterns_identified": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Key performance patterns identified from historical data"
+                },
+                "selected_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array of selected news item IDs"
+                },
+                "reasoning": {
+                    "type": "string",
+                    "description": "Data-driven justification for the selection"
+                }
+            },
+            "required": ["patterns_identified", "selected_ids", "reasoning"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Used when the tenant has no active news-selection prompt
+_DEFAULT_SELECTION_PROMPT = """You are a YouTube growth strategist and content performance analyst.
+
+## INPUT
+
+You will receive:
+
+1. HISTORICAL DATA: Up to 60 past videos with:
+   - Title and category
+   - YouTube statistics: Views, Likes, Comments, Watch time (minutes), Average retention (%)
+   - The news seed (topic summary) that was used
+
+2. AVAILABLE NEWS TODAY: New candidate news seeds to choose from.
+
+---
+
+## TASK
+
+1. Analyze the historical data to identify patterns that correlate with:
+   - High total views
+   - High retention rate (averageViewPercentage)
+   - Long watch time (estimatedMinutesWatched)
+   - Strong engagement (likes, comments ratio)
+
+2. Extract insights such as:
+   - Topic categories that perform best (Polska vs Świat)
+   - Emotional triggers that drive engagement
+   - Timing sensitivity (breaking news vs evergreen)
+   - Format tendencies (controversy, explainer, conflict, scandal, etc.)
+
+3. From the available news, select exactly {count} items most likely to generate high views and retention, based strictly on patterns from historical data.
+
+---
+
+HISTORICAL DATA (last 60 videos):
+{historical_data}
+
+AVAILABLE NEWS TODAY:
+{available_news}
+
+Select exactly {count} news items that will perform best on YouTube based on historical patterns."""
+_DEFAULT_SELECTION_TEMPERATURE = 0.7
+
+# Marks a field absent from a partial config update (distinct from an explicit None)
+_UNSET = object()
+
 
 class PromptSelections(BaseModel):
     """Prompt selections for runs - allows overriding the active prompt per type."""
@@ -49,6 +144,18 @@ class ScheduledRunConfig(BaseModel):
     selection_mode: SelectionMode = "random"  # Per-run selection mode
     prompts: Optional[PromptSelections] = None  # Override prompts for this run
 
+    _prompts_dict: Optional[dict] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Dumped once at parse time: model_copy() carries private attributes
+        # over, so the per-tick copies handed out by _load_cached reuse it.
+        if self.prompts is not None:
+            self._prompts_dict = self.prompts.model_dump(exclude_none=True)
+
+    def prompts_dict(self) -> Optional[dict]:
+        """Prompt overrides as a plain dict, or None if not set."""
+        return self._prompts_dict
+
 
 class SchedulerConfig(BaseModel):
     """Scheduler configuration."""
@@ -56,6 +163,7 @@ class SchedulerConfig(BaseModel):
     generation_time: str = "10:00"  # HH:MM format
     publish_time: str = "evening"  # Schedule option: "now" or "evening"
     runs: list[ScheduledRunConfig] = []  # Per-run configurations
+    max_parallel_runs: int = Field(2, ge=1, le=PIPELINE_MAX_WORKERS)  # Runs generated concurrently per scheduled job
 
 
 class SchedulerState(BaseModel):
@@ -78,6 +186,43 @@ class SchedulerStatus(BaseModel):
 # Global scheduler instance
 _scheduler: Optional[AsyncIOScheduler] = None
 
+# Parsed config/state per tenant storage prefix, tagged with the storage version
+# (mtime/ETag) they were read at. Guarded by _cache_lock: APScheduler jobs,
+# executor threads and admin routes all touch these.
+_config_cache: dict[str, tuple[Optional[str], SchedulerConfig]] = {}
+_state_cache: dict[str, tuple[Optional[str], SchedulerState]] = {}
+_cache_lock = threading.Lock()
+
+# Serializes config mutations (enable/disable/update). Readers don't take it —
+# they only ever see a whole SchedulerConfig object, swapped in by reference.
+_config_lock = asyncio.Lock()
+
+# Last applied (enabled, generation_time, timezone) per tenant job — skips no-op reschedules
+_job_signatures: dict[str, tuple] = {}
+
+# Concurrent storage reads when collecting historical runs for LLM selection.
+# The pool is long-lived (created on first use, closed in shutdown_scheduler).
+HISTORY_READ_WORKERS = 16
+_history_executor: Optional[ThreadPoolExecutor] = None
+
+# Dedicated pool for the long pipeline runs only (created in init_scheduler).
+# Short config/state/history I/O goes through asyncio.to_thread instead, so
+# it never queues behind hours of generation work.
+_pipeline_executor: Optional[ThreadPoolExecutor] = None
+
+
+async def _run_in_pool(fn, *args, **kwargs):
+    """Run a long pipeline job on the pipeline executor, preserving ContextVars.
+
+    Unlike asyncio.to_thread, run_in_executor does not copy the caller's
+    context, so the tenant storage prefix is propagated explicitly.
+    Falls back to the loop's default executor if the scheduler isn't initialized.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args, **kwargs)
+    return await loop.run_in_executor(_pipeline_executor, call)
+
 
 # ---------------------------------------------------------------------------
 # Tenant context helper
@@ -93,34 +238,67 @@ def _set_tenant_context(tenant: TenantConfig) -> None:
 # Config / state I/O  (use ContextVar-based storage — caller must set context)
 # ---------------------------------------------------------------------------
 
+def _load_cached(cache: dict, key: str, parse):
+    """
+    Return a copy of the parsed model stored at key, or None if the key is missing.
+    Storage is only re-read when the key's version differs from the cached one.
+    """
+    storage = get_config_storage()
+    version = storage.version(key)
+    if version is None:
+        return None
+
+    prefix = get_tenant_prefix()
+    with _cache_lock:
+        entry = cache.get(prefix)
+    if entry is None or entry[0] != version:
+        entry = (version, parse(storage.read_text(key)))
+        with _cache_lock:
+            cache[prefix] = entry
+    return entry[1].model_copy(deep=True)
+
+
+def _store_cached(cache: dict, key: str, model, content: str) -> None:
+    """Write content to key and remember model as its parsed form."""
+    storage = get_config_storage()
+    storage.write_text(key, content)
+    with _cache_lock:
+        cache[get_tenant_prefix()] = (storage.version(key), model.model_copy(deep=True))
+
+
 def _load_config() -> SchedulerConfig:
     """Load scheduler config from tenant's config storage."""
     try:
-        storage = get_config_storage()
-        if storage.exists("scheduler_config.json"):
-            content = storage.read_text("scheduler_config.json")
-            data = json.loads(content)
-            return SchedulerConfig(**data)
+        config = _load_cached(_config_cache, SCHEDULER_CONFIG_KEY, SchedulerConfig.model_validate_json)
+        if config is not None:
+            return config
     except Exception as e:
         logger.warning("Failed to load scheduler config: %s", e)
     return SchedulerConfig()
 
 
+def _get_config() -> SchedulerConfig:
+    """Return the cached config for the current tenant without checking storage.
+
+    The returned object is shared — don't mutate it, use model_copy().
+    """
+    with _cache_lock:
+        entry = _config_cache.get(get_tenant_prefix())
+    return entry[1] if entry is not None else _load_config()
+
+
 def _save_config(config: SchedulerConfig) -> None:
     """Save scheduler config to tenant's config storage."""
-    storage = get_config_storage()
-    content = json.dumps(config.model_dump(), indent=2)
-    storage.write_text("scheduler_config.json", content)
+    content = config.model_dump_json(indent=2)
+    _store_cached(_config_cache, SCHEDULER_CONFIG_KEY, config, content)
 
 
 def _load_state() -> SchedulerState:
     """Load scheduler state from tenant's config storage."""
     try:
-        storage = get_config_storage()
-        if storage.exists(SCHEDULER_STATE_KEY):
-            content = storage.read_text(SCHEDULER_STATE_KEY)
-            data = json.loads(content)
-            return SchedulerState(**data)
+        state = _load_cached(_state_cache, SCHEDULER_STATE_KEY, SchedulerState.model_validate_json)
+        if state is not None:
+            return state
     except Exception as e:
         logger.warning("Failed to load scheduler state: %s", e)
     return SchedulerState()
@@ -128,24 +306,69 @@ def _load_state() -> SchedulerState:
 
 def _save_state(state: SchedulerState) -> None:
     """Save scheduler state to tenant's config storage."""
-    storage = get_config_storage()
-    content = json.dumps(state.model_dump(), indent=2)
-    storage.write_text(SCHEDULER_STATE_KEY, content)
+    content = state.model_dump_json(indent=2)
+    _store_cached(_state_cache, SCHEDULER_STATE_KEY, state, content)
+
+
+async def _aload_config() -> SchedulerConfig:
+    """Load scheduler config off the event loop (for async callers)."""
+    return await asyncio.to_thread(_load_config)
+
+
+async def _aget_config() -> SchedulerConfig:
+    """_get_config off the event loop (it may fall back to a storage read)."""
+    return await asyncio.to_thread(_get_config)
+
+
+async def _asave_config(config: SchedulerConfig) -> None:
+    """Save scheduler config off the event loop (for async callers)."""
+    await asyncio.to_thread(_save_config, config)
+
+
+async def _aload_state() -> SchedulerState:
+    """Load scheduler state off the event loop (for async callers)."""
+    return await asyncio.to_thread(_load_state)
+
+
+async def _asave_state(state: SchedulerState) -> None:
+    """Save scheduler state off the event loop (for async callers)."""
+    await asyncio.to_thread(_save_state, state)
 
 
 # ---------------------------------------------------------------------------
 # News selection helpers (unchanged — work on whatever tenant context is set)
 # ---------------------------------------------------------------------------
 
-async def select_news_random(count: int, items: list[dict]) -> list[dict]:
-    """Select news items randomly from provided list."""
-    logger.info("Selecting %d random news items from %d available", count, len(items))
+def _weighted_sample(items: list[dict], k: int, rng: random.Random) -> list[dict]:
+    """Pick k items without replacement, weighted by rating (Efraimidis-Spirakis).
+
+    Keys are log(u) / weight, so unrated items (rating <= 0) still get a
+    random order among themselves, just below every rated item.
+    """
+    def key(item: dict) -> float:
+        weight = max(item.get("rating") or 0, 1e-9)
+        return math.log(1.0 - rng.random()) / weight
 
-    if not items:
+    return heapq.nlargest(k, items, key=key)
+
+
+async def select_news_random(
+    count: int,
+    items_by_id: dict[str, dict],
+    excluded_ids: Collection[str] = (),
+) -> list[dict]:
+    """Select news items randomly from provided id map, biased towards higher ratings.
+
+    Items whose id is in excluded_ids (already picked by another mode) are skipped.
+    """
+    candidates = [item for id_, item in items_by_id.items() if id_ not in excluded_ids]
+    logger.info("Selecting %d random news items from %d available", count, len(candidates))
+
+    if not candidates:
         logger.warning("No news items available for random selection")
         return []
 
-    selected = random.sample(items, min(count, len(items)))
+    selected = _weighted_sample(candidates, min(count, len(candidates)), random.Random())
 
     logger.info("Selected %d news items randomly", len(selected))
     for item in selected:
@@ -154,179 +377,156 @@ async def select_news_random(count: int, items: list[dict]) -> list[dict]:
     return selected
 
 
-def _get_news_selection_prompt() -> tuple[str, float]:
-    """Get the news selection prompt content and temperature."""
-    active_id = prompts_service.get_active_prompt_id("news-selection")
-    if active_id:
-        prompt = prompts_service.get_prompt("news-selection", active_id)
-        if prompt:
-            return prompt.content, prompt.temperature
+# Placeholders understood by news-selection prompts. Stored prompts are free-form
+# markdown (may contain literal braces), so only these names are substituted.
+_PROMPT_PLACEHOLDER_RE = re.compile(r"\{(historical_data|available_news|count)\}")
 
-    # Default prompt if none configured
-    default_prompt = """You are a YouTube growth strategist and content performance analyst.
 
-## INPUT
+@functools.lru_cache(maxsize=16)
+def _compile_prompt_template(template: str) -> tuple[str, ...]:
+    """Split a prompt once into alternating literal / placeholder-name parts."""
+    return tuple(_PROMPT_PLACEHOLDER_RE.split(template))
 
-You will receive:
 
-1. HISTORICAL DATA: Up to 60 past videos with:
-   - Title and category
-   - YouTube statistics: Views, Likes, Comments, Watch time (minutes), Average retention (%)
-   - The news seed (topic summary) that was used
-
-2. AVAILABLE NEWS TODAY: New candidate news seeds to choose from.
-
----
+def _render_prompt(template: str, **values: str) -> str:
+    """Fill the template's placeholders in a single join over its cached parts."""
+    parts = _compile_prompt_template(template)
+    return "".join(values[part] if i % 2 else part for i, part in enumerate(parts))
 
-## TASK
 
-1. Analyze the historical data to identify patterns that correlate with:
-   - High total views
-   - High retention rate (averageViewPercentage)
-   - Long watch time (estimatedMinutesWatched)
-   - Strong engagement (likes, comments ratio)
+def _get_news_selection_prompt() -> tuple[str, float]:
+    """Get the news selection prompt content and temperature."""
+    prompt = prompts_service.get_active_prompt("news-selection")
+    if prompt:
+        return prompt.content, prompt.temperature
+    return _DEFAULT_SELECTION_PROMPT, _DEFAULT_SELECTION_TEMPERATURE
+
+
+def _format_historical_run(run: dict) -> str:
+    """Format a single historical run for the LLM prompt."""
+    stats = run.get("yt_stats", {})
+    source = run.get("source_info", {})
+    seed = run.get("news_seed", "")[:200]
+
+    return (
+        f"- Title: {source.get('title', 'Unknown')}\n"
+        f"  Category: {source.get('category', 'Unknown')}\n"
+        f"  Views: {stats.get('views', 0)}, "
+        f"Likes: {stats.get('likes', 0)}, "
+        f"Comments: {stats.get('comments', 0)}\n"
+        f"  Watch time: {stats.get('estimatedMinutesWatched', 0):.1f} min, "
+        f"Avg retention: {stats.get('averageViewPercentage', 0):.1f}%\n"
+        f"  Summary: {seed}..."
+    )
 
-2. Extract insights such as:
-   - Topic categories that perform best (Polska vs Świat)
-   - Emotional triggers that drive engagement
-   - Timing sensitivity (breaking news vs evergreen)
-   - Format tendencies (controversy, explainer, conflict, scandal, etc.)
 
-3. From the available news, select exactly {count} items most likely to generate high views and retention, based strictly on patterns from historical data.
+def _format_historical_data(runs_with_stats: list[dict]) -> str:
+    """Format historical run data for the LLM prompt."""
+    if not runs_with_stats:
+        return "No historical data available yet."
 
----
+    return "\n\n".join(_format_historical_run(run) for run in runs_with_stats)
 
-HISTORICAL DATA (last 60 videos):
-{historical_data}
 
-AVAILABLE NEWS TODAY:
-{available_news}
+def _format_news_item(item: dict) -> str:
+    """Format a single available news item for the LLM prompt."""
+    return (
+        f"ID: {item.get('id')}\n"
+        f"Category: {item.get('category')}\n"
+        f"Title: {item.get('title', 'No title')}\n"
+        f"Rating: {item.get('rating', 0):.1f}\n"
+        f"Content: {item.get('content', '')[:300]}..."
+    )
 
-Select exactly {count} news items that will perform best on YouTube based on historical patterns."""
 
-    return default_prompt, 0.7
+def _format_available_news(items: Iterable[dict]) -> str:
+    """Format available news items for the LLM prompt."""
+    return "\n\n---\n\n".join(_format_news_item(item) for item in items)
 
 
-def _format_historical_data(runs_with_stats: list[dict]) -> str:
-    """Format historical run data for the LLM prompt."""
-    if not runs_with_stats:
-        return "No historical data available yet."
+def _read_run_bundle(run_info: dict, keys: dict) -> Optional[dict]:
+    """Read seed and cached YouTube stats for one run (None if it has no stats)."""
+    run_id = run_info["run_id"]
+    run_storage = get_run_storage(run_id)
 
-    lines = []
-    for run in runs_with_stats:
-        stats = run.get("yt_stats", {})
-        source = run.get("source_info", {})
-        seed = run.get("news_seed", "")[:200]
-
-        line = (
-            f"- Title: {source.get('title', 'Unknown')}\n"
-            f"  Category: {source.get('category', 'Unknown')}\n"
-            f"  Views: {stats.get('views', 0)}, "
-            f"Likes: {stats.get('likes', 0)}, "
-            f"Comments: {stats.get('comments', 0)}\n"
-            f"  Watch time: {stats.get('estimatedMinutesWatched', 0):.1f} min, "
-            f"Avg retention: {stats.get('averageViewPercentage', 0):.1f}%\n"
-            f"  Summary: {seed}..."
-        )
-        lines.append(line)
+    if not run_storage.exists(keys["yt_upload"]):
+        return None
 
-    return "\n\n".join(lines)
+    try:
+        stats_content = run_storage.try_read_bytes("yt_stats.json")
+        if stats_content is None:
+            return None
+        seed_data = orjson.loads(run_storage.read_bytes(keys["seed"]))
+        stats_data = orjson.loads(stats_content)
+    except Exception as e:
+        logger.debug("Error reading run %s: %s", run_id, e)
+        return None
 
+    return {
+        "run_id": run_id,
+        "created_at": run_info.get("created_at"),
+        "news_seed": seed_data.get("news_seed", ""),
+        "source_info": seed_data.get("source_info", {}),
+        "yt_stats": stats_data.get("stats", {}),
+    }
 
-def _format_available_news(items: list[dict]) -> str:
-    """Format available news items for the LLM prompt."""
-    lines = []
-    for item in items:
-        line = (
-            f"ID: {item.get('id')}\n"
-            f"Category: {item.get('category')}\n"
-            f"Title: {item.get('title', 'No title')}\n"
-            f"Rating: {item.get('rating', 0):.1f}\n"
-            f"Content: {item.get('content', '')[:300]}..."
-        )
-        lines.append(line)
 
-    return "\n\n---\n\n".join(lines)
+def _get_history_executor() -> ThreadPoolExecutor:
+    global _history_executor
+    with _cache_lock:
+        if _history_executor is None:
+            _history_executor = ThreadPoolExecutor(
+                max_workers=HISTORY_READ_WORKERS, thread_name_prefix="history-read"
+            )
+        return _history_executor
 
 
 def _get_recent_runs_with_stats(limit: int = 60) -> list[dict]:
     """Get recent runs with their seeds and YouTube stats."""
-    from ..core.storage_config import get_run_storage
+    from . import pipeline
 
     runs = pipeline.list_runs()
     keys = pipeline.get_run_keys()
 
+    executor = _get_history_executor()
     results = []
-    for run_info in runs:
-        run_id = run_info["run_id"]
-        run_storage = get_run_storage(run_id)
-
-        if not run_storage.exists(keys["yt_upload"]):
-            continue
-
-        if not run_storage.exists("yt_stats.json"):
-            continue
-
-        try:
-            seed_content = run_storage.read_text(keys["seed"])
-            seed_data = json.loads(seed_content)
-
-            stats_content = run_storage.read_text("yt_stats.json")
-            stats_data = json.loads(stats_content)
-
-            results.append({
-                "run_id": run_id,
-                "created_at": run_info.get("created_at"),
-                "news_seed": seed_data.get("news_seed", ""),
-                "source_info": seed_data.get("source_info", {}),
-                "yt_stats": stats_data.get("stats", {}),
-            })
-
-            if len(results) >= limit:
-                break
-        except Exception as e:
-            logger.debug("Error reading run %s: %s", run_id, e)
-            continue
+    # Read newest-first in windows of `limit`, stopping once enough runs qualify.
+    for start in range(0, len(runs), limit):
+        window = runs[start:start + limit]
+        bundles = map_in_tenant_context(
+            executor, _read_run_bundle, window, [keys] * len(window)
+        )
+        results.extend(b for b in bundles if b is not None)
+        if len(results) >= limit:
+            break
 
-    return results
+    return results[:limit]
 
 
 def _refresh_stats_for_recent_runs(limit: int = 60) -> int:
-    """Refresh YouTube stats for recent runs that have uploads."""
-    from concurrent.futures import ThreadPoolExecutor
-
-    logger.info("Starting parallel YouTube stats refresh for up to %d runs", limit)
-    runs = pipeline.list_runs()
-
-    candidate_runs = []
-    for run_info in runs[:limit]:
-        run_id = run_info["run_id"]
-        candidate_runs.append(run_id)
-
-    def refresh_task(run_id):
-        try:
-            logger.info("  Starting refresh task for run: %s", run_id)
-            result = youtube_analytics.get_or_fetch_stats(run_id, force=False, max_age_hours=24)
-            logger.info("  Completed refresh task for run: %s (result: %s)", run_id, "updated" if result else "cached/skipped")
-            return 1 if result else 0
-        except Exception as e:
-            logger.error("  Error in refresh task for %s: %s", run_id, e)
-            return 0
+    """
+    Refresh YouTube stats for recent runs that have uploads.
+    Best-effort warm-up for LLM selection: errors are logged, never raised.
+    """
+    from . import pipeline, youtube_analytics
 
-    updated = 0
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        results = list(executor.map(refresh_task, candidate_runs))
-        updated = sum(results)
+    logger.info("Starting batched YouTube stats refresh for up to %d runs", limit)
+    try:
+        candidate_runs = [run_info["run_id"] for run_info in pipeline.list_runs()[:limit]]
+        updated = youtube_analytics.get_or_fetch_stats_bulk(candidate_runs, max_age_hours=24)
+    except Exception as e:
+        logger.error("YouTube stats refresh failed: %s", e)
+        return 0
 
-    logger.info("Refreshed YouTube stats for %d runs", updated)
-    return updated
+    logger.info("Refreshed YouTube stats for %d runs", len(updated))
+    return len(updated)
 
 
-async def select_news_llm(count: int, items: list[dict]) -> list[dict]:
+async def select_news_llm(count: int, items_by_id: dict[str, dict]) -> list[dict]:
     """Select news items using LLM based on historical performance."""
-    logger.info("Selecting %d news items using LLM from %d available", count, len(items))
+    logger.info("Selecting %d news items using LLM from %d available", count, len(items_by_id))
 
-    if not items:
+    if not items_by_id:
         logger.warning("No news items available for LLM selection")
         return []
 
@@ -339,70 +539,39 @@ async def select_news_llm(count: int, items: list[dict]) -> list[dict]:
     prompt_template, temperature = _get_news_selection_prompt()
 
     historical_data = _format_historical_data(runs_with_stats)
-    available_news = _format_available_news(items)
+    available_news = _format_available_news(items_by_id.values())
 
-    prompt = (
-        prompt_template
-        .replace("{historical_data}", historical_data)
-        .replace("{available_news}", available_news)
-        .replace("{count}", str(count))
+    prompt = _render_prompt(
+        prompt_template,
+        historical_data=historical_data,
+        available_news=available_news,
+        count=str(count),
     )
 
-    logger.info("=== FINAL LLM NEWS SELECTION PROMPT ===")
-    logger.info(prompt)
-    logger.info("========================================")
+    logger.debug("=== FINAL LLM NEWS SELECTION PROMPT ===\n%s\n========================================", prompt)
 
     try:
-        from .openrouter import NEWS_SELECTION, get_chat_client
         logger.info("Calling OpenRouter API (model=%s)...", NEWS_SELECTION)
 
-        client = get_chat_client()
-        response = client.chat.completions.create(
+        client = get_async_chat_client()
+        response = await client.chat.completions.create(
             model=NEWS_SELECTION,
             messages=[{"role": "user", "content": prompt}],
             temperature=temperature,
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "news_selection",
-                    "strict": True,
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "patterns_identified": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Key performance patterns identified from historical data"
-                            },
-                            "selected_ids": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Array of selected news item IDs"
-                            },
-                            "reasoning": {
-                                "type": "string",
-                                "description": "Data-driven justification for the selection"
-                            }
-                        },
-                        "required": ["patterns_identified", "selected_ids", "reasoning"],
-                        "additionalProperties": False
-                    }
-                }
-            }
+            response_format=_NEWS_SELECTION_SCHEMA,
         )
 
         result_text = response.choices[0].message.content.strip()
         logger.info("OpenAI API response received")
         logger.debug("Raw LLM response: %s", result_text)
 
-        result = json.loads(result_text)
+        result = orjson.loads(result_text)
         selected_ids = result.get("selected_ids", [])
         reasoning = result.get("reasoning", "")
 
         logger.info("LLM reasoning: %s", reasoning)
 
-        id_to_item = {item.get("id"): item for item in items}
-        selected = [id_to_item[id_] for id_ in selected_ids if id_ in id_to_item]
+        selected = [items_by_id[id_] for id_ in selected_ids if id_ in items_by_id]
 
         for item in selected:
             item["_llm_reasoning"] = reasoning
@@ -416,15 +585,16 @@ async def select_news_llm(count: int, items: list[dict]) -> list[dict]:
     except Exception as e:
         logger.error("LLM news selection failed: %s", e, exc_info=True)
         logger.info("Falling back to random selection")
-        return await select_news_random(count, items)
+        return await select_news_random(count, items_by_id)
 
 
 async def select_news(mode: SelectionMode, count: int, items: list[dict]) -> list[dict]:
     """Select news items for video generation."""
+    items_by_id = {item.get("id"): item for item in items}
     if mode == "llm":
-        return await select_news_llm(count, items)
+        return await select_news_llm(count, items_by_id)
     else:
-        return await select_news_random(count, items)
+        return await select_news_random(count, items_by_id)
 
 
 # ---------------------------------------------------------------------------
@@ -438,6 +608,8 @@ async def run_auto_generation_for_news(
     language: str = "pl",
 ) -> tuple[str, Optional[str]]:
     """Run the full generation pipeline for a single news item."""
+    from . import pipeline
+
     run_id = None
     try:
         provider = news_item.get("_provider", "infopigula")
@@ -459,27 +631,7 @@ async def run_auto_generation_for_news(
 
         logger.info("Created run %s for auto-generation", run_id)
 
-        logger.info("[%s] Generating dialogue...", run_id)
-        await asyncio.to_thread(pipeline.generate_dialogue_for_run, run_id)
-
-        logger.info("[%s] Generating audio...", run_id)
-        await asyncio.to_thread(pipeline.generate_audio_for_run, run_id, language=language)
-
-        logger.info("[%s] Generating images...", run_id)
-        await asyncio.to_thread(pipeline.generate_images_for_run, run_id)
-
-        logger.info("[%s] Generating video...", run_id)
-        await asyncio.to_thread(pipeline.generate_video_for_run, run_id)
-
-        logger.info("[%s] Generating YouTube metadata...", run_id)
-        await asyncio.to_thread(pipeline.generate_yt_metadata_for_run, run_id)
-
-        logger.info("[%s] Uploading to YouTube (schedule: %s)...", run_id, publish_time)
-        await asyncio.to_thread(
-            pipeline.upload_to_youtube_for_run,
-            run_id,
-            schedule_option=publish_time
-        )
+        await _run_in_pool(pipeline.run_full_pipeline, run_id, publish_time, language)
 
         logger.info("[%s] Auto-generation completed successfully", run_id)
         return run_id, None
@@ -497,10 +649,10 @@ async def run_auto_generation(tenant: TenantConfig) -> dict:
     """
     logger.info("=== Starting auto-generation for tenant: %s ===", tenant.id)
 
-    config = _load_config()
-    state = _load_state()
+    config = await _aload_config()
+    state = await _aload_state()
 
-    state.last_run_at = datetime.now().isoformat()
+    state.last_run_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
     state.last_run_runs = []
     state.last_run_errors = []
 
@@ -508,7 +660,7 @@ async def run_auto_generation(tenant: TenantConfig) -> dict:
     if not enabled_runs:
         state.last_run_status = "error"
         state.last_run_errors = ["No runs configured"]
-        _save_state(state)
+        await _asave_state(state)
         logger.error("Auto-generation aborted for %s: no runs configured", tenant.id)
         return {"status": "error", "message": "No runs configured"}
 
@@ -524,7 +676,7 @@ async def run_auto_generation(tenant: TenantConfig) -> dict:
     if not available_items:
         state.last_run_status = "error"
         state.last_run_errors = ["No news items available"]
-        _save_state(state)
+        await _asave_state(state)
         logger.error("Auto-generation aborted for %s: no news available", tenant.id)
         return {"status": "error", "message": "No news available"}
 
@@ -535,53 +687,55 @@ async def run_auto_generation(tenant: TenantConfig) -> dict:
         runs_by_mode[mode].append(i)
 
     selected_news_map: dict[int, dict] = {}
-    remaining_items = list(available_items)
+    excluded_ids: set = set()
+    items_by_id = {item.get("id"): item for item in available_items}
 
     if runs_by_mode["llm"]:
         count = len(runs_by_mode["llm"])
-        selected = await select_news_llm(count, remaining_items)
-        for i, idx in enumerate(runs_by_mode["llm"]):
-            if i < len(selected):
-                item = selected[i]
-                selected_news_map[idx] = item
-                item_id = item.get("id")
-                remaining_items = [it for it in remaining_items if it.get("id") != item_id]
+        selected = await select_news_llm(count, items_by_id)
+        for idx, item in zip(runs_by_mode["llm"], selected):
+            selected_news_map[idx] = item
+            excluded_ids.add(item.get("id"))
 
     if runs_by_mode["random"]:
         count = len(runs_by_mode["random"])
-        selected = await select_news_random(count, remaining_items)
-        for i, idx in enumerate(runs_by_mode["random"]):
-            if i < len(selected):
-                item = selected[i]
-                selected_news_map[idx] = item
-                item_id = item.get("id")
-                remaining_items = [it for it in remaining_items if it.get("id") != item_id]
+        selected = await select_news_random(count, items_by_id, excluded_ids)
+        for idx, item in zip(runs_by_mode["random"], selected):
+            selected_news_map[idx] = item
+            excluded_ids.add(item.get("id"))
 
     if not selected_news_map:
         state.last_run_status = "error"
         state.last_run_errors = ["No news items selected"]
-        _save_state(state)
+        await _asave_state(state)
         logger.error("Auto-generation aborted for %s: no news selected", tenant.id)
         return {"status": "error", "message": "No news selected"}
 
+    semaphore = asyncio.Semaphore(config.max_parallel_runs)
+    ordered_indices = sorted(selected_news_map.keys())
+
+    async def _bounded_run(position: int, idx: int) -> tuple[str, Optional[str]]:
+        async with semaphore:
+            logger.info("Processing run %d/%d (index %d) for tenant %s",
+                        position, len(ordered_indices), idx, tenant.id)
+            return await run_auto_generation_for_news(
+                selected_news_map[idx],
+                config.publish_time,
+                prompts=enabled_runs[idx].prompts_dict(),
+                language=tenant.language,
+            )
+
+    outcomes = await asyncio.gather(
+        *(_bounded_run(pos, idx) for pos, idx in enumerate(ordered_indices, 1)),
+        return_exceptions=True,
+    )
+
     results = []
-    for idx in sorted(selected_news_map.keys()):
-        news_item = selected_news_map[idx]
-        run_config = enabled_runs[idx]
-
-        prompts_dict = None
-        if run_config.prompts:
-            prompts_dict = run_config.prompts.model_dump(exclude_none=True)
-
-        logger.info("Processing run %d/%d (index %d) for tenant %s",
-                    len(results) + 1, len(selected_news_map), idx, tenant.id)
-
-        run_id, error = await run_auto_generation_for_news(
-            news_item,
-            config.publish_time,
-            prompts=prompts_dict,
-            language=tenant.language,
-        )
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            run_id, error = "unknown", f"Failed at run creation: {outcome}"
+        else:
+            run_id, error = outcome
         results.append({"run_id": run_id, "error": error})
         if run_id and run_id != "unknown":
             state.last_run_runs.append(run_id)
@@ -596,7 +750,7 @@ async def run_auto_generation(tenant: TenantConfig) -> dict:
     else:
         state.last_run_status = "error"
 
-    _save_state(state)
+    await _asave_state(state)
 
     logger.info("=== Auto-generation complete for %s: %d/%d successful ===",
                 tenant.id, successful, len(results))
@@ -626,27 +780,42 @@ async def _run_tenant_pipeline(tenant: TenantConfig) -> None:
 # Scheduler management
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def _get_zone(name: str) -> ZoneInfo:
+    """Resolve a timezone name once and reuse the ZoneInfo for every trigger."""
+    return ZoneInfo(name)
+
+
 def _schedule_tenant_job(tenant: TenantConfig, config: SchedulerConfig) -> None:
     """Schedule (or reschedule) the cron job for a specific tenant."""
     global _scheduler
     if _scheduler is None:
         return
 
+    signature = (config.enabled, config.generation_time, tenant.timezone)
+    if _job_signatures.get(tenant.id) == signature:
+        logger.debug("Schedule unchanged for tenant %s — keeping existing job", tenant.id)
+        return
+
+    # Forget the old signature with the old job, and record the new one only
+    # once it's in effect — a failed reschedule must not look "unchanged"
     job_id = f"generate_{tenant.id}"
+    _job_signatures.pop(tenant.id, None)
     if _scheduler.get_job(job_id):
         _scheduler.remove_job(job_id)
 
     if not config.enabled:
         logger.info("Scheduler disabled for tenant %s — job not scheduled", tenant.id)
+        _job_signatures[tenant.id] = signature
         return
 
-    try:
-        hour, minute = map(int, config.generation_time.split(":"))
-    except ValueError:
+    match = _TIME_RE.match(config.generation_time)
+    if not match:
         logger.error("Invalid generation_time '%s' for tenant %s", config.generation_time, tenant.id)
         return
+    hour, minute = int(match.group(1)), int(match.group(2))
 
-    trigger = CronTrigger(hour=hour, minute=minute, timezone=tenant.timezone)
+    trigger = CronTrigger(hour=hour, minute=minute, timezone=_get_zone(tenant.timezone))
     _scheduler.add_job(
         _run_tenant_pipeline,
         trigger=trigger,
@@ -654,8 +823,11 @@ def _schedule_tenant_job(tenant: TenantConfig, config: SchedulerConfig) -> None:
         name=f"Daily generation ({tenant.id})",
         replace_existing=True,
         misfire_grace_time=3600,
+        coalesce=True,  # collapse missed fires into one run
+        max_instances=1,  # never overlap a still-running generation
         args=[tenant],
     )
+    _job_signatures[tenant.id] = signature
 
     job = _scheduler.get_job(job_id)
     next_run = str(job.next_run_time) if job and job.next_run_time else None
@@ -664,10 +836,15 @@ def _schedule_tenant_job(tenant: TenantConfig, config: SchedulerConfig) -> None:
 
 def init_scheduler(tenants: list[TenantConfig]) -> None:
     """Initialize the scheduler on application startup with one job per tenant."""
-    global _scheduler
+    global _scheduler, _pipeline_executor
 
     logger.info("Initializing scheduler for %d tenant(s)...", len(tenants))
 
+    _pipeline_executor = ThreadPoolExecutor(
+        max_workers=PIPELINE_MAX_WORKERS, thread_name_prefix="pipeline"
+    )
+
+    _job_signatures.clear()
     _scheduler = AsyncIOScheduler()
     _scheduler.start()
     logger.info("Scheduler started")
@@ -683,13 +860,22 @@ def init_scheduler(tenants: list[TenantConfig]) -> None:
 
 def shutdown_scheduler() -> None:
     """Shutdown the scheduler gracefully."""
-    global _scheduler
+    global _scheduler, _pipeline_executor, _history_executor
 
     if _scheduler:
         logger.info("Shutting down scheduler...")
         _scheduler.shutdown(wait=False)
         _scheduler = None
 
+    if _pipeline_executor:
+        _pipeline_executor.shutdown(wait=False)
+        _pipeline_executor = None
+
+    with _cache_lock:
+        if _history_executor:
+            _history_executor.shutdown(wait=False)
+            _history_executor = None
+
 
 # ---------------------------------------------------------------------------
 # Per-tenant API functions (called by route handlers)
@@ -701,10 +887,12 @@ def get_tenant_scheduler_status(tenant: TenantConfig) -> SchedulerStatus:
     config = _load_config()
     state = _load_state()
 
+    # Disabled tenants have no job — skip the jobstore lookup
     job_id = f"generate_{tenant.id}"
-    job = _scheduler.get_job(job_id) if _scheduler else None
+    job = _scheduler.get_job(job_id) if _scheduler and config.enabled else None
     if job and job.next_run_time:
-        state.next_run_at = str(job.next_run_time)
+        next_run_utc = job.next_run_time.astimezone(timezone.utc)
+        state.next_run_at = next_run_utc.isoformat(timespec="seconds")
 
     return SchedulerStatus(
         enabled=config.enabled,
@@ -714,52 +902,50 @@ def get_tenant_scheduler_status(tenant: TenantConfig) -> SchedulerStatus:
     )
 
 
-def enable_tenant_scheduler(tenant: TenantConfig) -> SchedulerConfig:
+async def enable_tenant_scheduler(tenant: TenantConfig) -> SchedulerConfig:
     """Enable the scheduler for a specific tenant."""
     _set_tenant_context(tenant)
-    config = _load_config()
-    config.enabled = True
-    _save_config(config)
-    _schedule_tenant_job(tenant, config)
+    async with _config_lock:
+        config = await _aload_config()
+        config.enabled = True
+        await _asave_config(config)
+        _schedule_tenant_job(tenant, config)
     return config
 
 
-def disable_tenant_scheduler(tenant: TenantConfig) -> SchedulerConfig:
+async def disable_tenant_scheduler(tenant: TenantConfig) -> SchedulerConfig:
     """Disable the scheduler for a specific tenant."""
     _set_tenant_context(tenant)
-    config = _load_config()
-    config.enabled = False
-    _save_config(config)
-    job_id = f"generate_{tenant.id}"
-    if _scheduler and _scheduler.get_job(job_id):
-        _scheduler.remove_job(job_id)
-        logger.info("Removed job %s", job_id)
+    async with _config_lock:
+        config = await _aload_config()
+        config.enabled = False
+        await _asave_config(config)
+        job_id = f"generate_{tenant.id}"
+        _job_signatures.pop(tenant.id, None)
+        if _scheduler and _scheduler.get_job(job_id):
+            _scheduler.remove_job(job_id)
+            logger.info("Removed job %s", job_id)
     return config
 
 
-def update_tenant_scheduler_config(tenant: TenantConfig, updates: dict) -> SchedulerConfig:
+async def update_tenant_scheduler_config(tenant: TenantConfig, updates: dict) -> SchedulerConfig:
     """Update scheduler configuration for a specific tenant and reschedule."""
     _set_tenant_context(tenant)
-    config = _load_config()
+    updates = dict(updates)
+    runs_data = updates.pop("runs", _UNSET)
+    fields = {k: v for k, v in updates.items() if k in SchedulerConfig.model_fields}
 
-    if "enabled" in updates:
-        config.enabled = updates["enabled"]
-    if "generation_time" in updates:
-        config.generation_time = updates["generation_time"]
-    if "publish_time" in updates:
-        config.publish_time = updates["publish_time"]
-    if "runs" in updates:
-        runs_data = updates["runs"]
-        if runs_data is None:
-            config.runs = []
-        else:
+    async with _config_lock:
+        config = (await _aget_config()).model_copy(update=fields)
+
+        if runs_data is not _UNSET:
             config.runs = [
                 ScheduledRunConfig(**r) if isinstance(r, dict) else r
-                for r in runs_data
+                for r in runs_data or []
             ]
 
-    _save_config(config)
-    _schedule_tenant_job(tenant, config)
+        await _asave_config(config)
+        _schedule_tenant_job(tenant, config)
     return config
 
 
@@ -773,7 +959,7 @@ async def trigger_tenant_run(tenant: TenantConfig) -> dict:
 async def test_tenant_news_selection(tenant: TenantConfig) -> dict:
     """Test news selection without running generation for a specific tenant."""
     _set_tenant_context(tenant)
-    config = _load_config()
+    config = await _aload_config()
 
     enabled_runs = [r for r in config.runs if r.enabled]
     if not enabled_runs:
@@ -800,27 +986,22 @@ async def test_tenant_news_selection(tenant: TenantConfig) -> dict:
         runs_by_mode[mode].append(i)
 
     selected_news_map: dict[int, dict] = {}
-    remaining_items = list(available_items)
+    excluded_ids: set = set()
+    items_by_id = {item.get("id"): item for item in available_items}
 
     if runs_by_mode["llm"]:
         count = len(runs_by_mode["llm"])
-        selected = await select_news_llm(count, remaining_items)
-        for i, idx in enumerate(runs_by_mode["llm"]):
-            if i < len(selected):
-                item = selected[i]
-                selected_news_map[idx] = item
-                item_id = item.get("id")
-                remaining_items = [it for it in remaining_items if it.get("id") != item_id]
+        selected = await select_news_llm(count, items_by_id)
+        for idx, item in zip(runs_by_mode["llm"], selected):
+            selected_news_map[idx] = item
+            excluded_ids.add(item.get("id"))
 
     if runs_by_mode["random"]:
         count = len(runs_by_mode["random"])
-        selected = await select_news_random(count, remaining_items)
-        for i, idx in enumerate(runs_by_mode["random"]):
-            if i < len(selected):
-                item = selected[i]
-                selected_news_map[idx] = item
-                item_id = item.get("id")
-                remaining_items = [it for it in remaining_items if it.get("id") != item_id]
+        selected = await select_news_random(count, items_by_id, excluded_ids)
+        for idx, item in zip(runs_by_mode["random"], selected):
+            selected_news_map[idx] = item
+            excluded_ids.add(item.get("id"))
 
     selected_items = [selected_news_map[idx] for idx in sorted(selected_news_map.keys())]
 
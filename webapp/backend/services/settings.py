@@ -3,13 +3,14 @@ Settings service - manages global webapp settings.
 Settings are persisted to a JSON file (local) or S3 (cloud).
 """
 
-import json
+import threading
+import time
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from ..core.storage_config import get_config_storage, is_s3_enabled
+from ..core.storage_config import get_config_storage, get_project_root, get_tenant_prefix
 
 # Settings key within tenant data storage
 SETTINGS_KEY = "settings.json"
@@ -81,19 +82,54 @@ class Settings(BaseModel):
     speakers: list[Speaker] = []
 
 
+# Prebuilt validator for the load/save paths
+_SETTINGS_ADAPTER = TypeAdapter(Settings)
+
+
+# Parsed settings per tenant storage prefix, tagged with the storage version
+# (mtime/ETag) they were read at and when that version was last confirmed.
+# Route handlers and pipeline threads share it.
+_settings_cache: dict[str, tuple[Optional[str], Settings, float]] = {}
+_settings_cache_lock = threading.Lock()
+
+# How long a confirmed version is trusted before load_settings() checks
+# storage again (a stat locally, a HeadObject on S3). Writes made through
+# save_settings() in this process are visible immediately; this only bounds
+# how long an outside edit of settings.json can go unnoticed.
+SETTINGS_RECHECK_SECONDS = 2.0
+
+
 def get_default_settings() -> Settings:
     """Return default settings."""
     return Settings()
 
 
 def load_settings() -> Settings:
-    """Load settings from storage (local file or S3)."""
+    """
+    Load settings from storage (local file or S3).
+    Storage is only re-read when the file's version changes, and the version
+    itself at most every SETTINGS_RECHECK_SECONDS; callers get their own copy,
+    safe to mutate and pass back to save_settings().
+    """
     try:
+        prefix = get_tenant_prefix()
+        with _settings_cache_lock:
+            entry = _settings_cache.get(prefix)
+        now = time.monotonic()
+        if entry is not None and now - entry[2] < SETTINGS_RECHECK_SECONDS:
+            return entry[1].model_copy(deep=True)
+
         storage = get_config_storage()
-        if storage.exists(SETTINGS_KEY):
-            content = storage.read_text(SETTINGS_KEY)
-            data = json.loads(content)
-            return Settings(**data)
+        version = storage.version(SETTINGS_KEY)
+        if version is not None:
+            if entry is None or entry[0] != version:
+                content = storage.read_bytes(SETTINGS_KEY)
+                entry = (version, _SETTINGS_ADAPTER.validate_json(content), now)
+            else:
+                entry = (version, entry[1], now)
+            with _settings_cache_lock:
+                _settings_cache[prefix] = entry
+            return entry[1].model_copy(deep=True)
     except Exception:
         pass
 
@@ -101,10 +137,18 @@ def load_settings() -> Settings:
 
 
 def save_settings(settings: Settings) -> None:
-    """Save settings to storage (local file or S3)."""
+    """
+    Save settings to storage (local file or S3).
+    Validates once here — callers edit fields in place, which Pydantic doesn't
+    check — so load_settings() can trust what it gets back from the cache.
+    """
+    settings = _SETTINGS_ADAPTER.validate_python(settings.model_dump())
     storage = get_config_storage()
-    content = json.dumps(settings.model_dump(), indent=2)
-    storage.write_text(SETTINGS_KEY, content)
+    storage.write_bytes(SETTINGS_KEY, _SETTINGS_ADAPTER.dump_json(settings, indent=2))
+    with _settings_cache_lock:
+        _settings_cache[get_tenant_prefix()] = (
+            storage.version(SETTINGS_KEY), settings, time.monotonic()
+        )
 
 
 def get_episode_number() -> int:
@@ -139,7 +183,7 @@ def get_prompt_paths(version: PromptVersion) -> tuple[Path, Path]:
     Get dialogue prompt paths for given version (legacy local interface).
     Returns (main_prompt_path, refine_prompt_path).
     """
-    data_dir = PROJECT_ROOT / "data" / "dialogue-prompt"
+    data_dir = get_project_root() / "data" / "dialogue-prompt"
     main_prompt = data_dir / f"prompt-{version}.md"
     refine_prompt = data_dir / f"prompt-{version}-step-2.md"
     return main_prompt, refine_prompt
@@ -5,16 +5,25 @@ Uses YouTube Analytics API v2 to fetch metrics like views, watch time,
 likes, comments, and shares.
 """
 
-import json
-from datetime import datetime, timedelta, timezone
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+import orjson
 
 from ..core.logging_config import get_logger
-from ..core.storage_config import get_run_storage, get_project_root, get_credentials_dir
+from ..core.storage_config import (
+    get_credentials_dir,
+    get_project_root,
+    get_run_storage,
+    get_tenant_prefix,
+    map_in_tenant_context,
+)
+from .cache import RunsCache
 
 logger = get_logger(__name__)
 
@@ -26,10 +35,71 @@ SCOPES = [
     "https://www.googleapis.com/auth/yt-analytics.readonly",
 ]
 
+# Serializes token.json refreshes within the process
+_token_lock = threading.Lock()
+
+# Built Analytics services per thread: {credentials_dir: (token mtime, creds, service)}
+_thread_services = threading.local()
+
+# Concurrent per-run storage reads/writes in get_or_fetch_stats_bulk
+BULK_IO_WORKERS = 8
+_io_executor: Optional[ThreadPoolExecutor] = None
+_io_executor_lock = threading.Lock()
+
+# Parsed yt_stats.json per tenant/run, so repeated freshness checks skip the
+# storage round-trip. Kept short: it only bounds how long an outside write
+# to yt_stats.json can go unnoticed.
+STATS_MEMO_TTL = 900.0
+_stats_memo = RunsCache(default_ttl=STATS_MEMO_TTL)
+
+# Runs known to have no uploaded video (no yt_upload.json, or one without a
+# video_id), per tenant. Time-limited rather than permanent since an upload
+# can land later; the pipeline also clears the entry when it writes one.
+NO_UPLOAD_TTL = 300.0
+_no_upload_memo = RunsCache(default_ttl=NO_UPLOAD_TTL)
+
+# Date range queried for stats — wide enough to cover a video's whole life
+STATS_WINDOW = timedelta(days=365)
+
+# Max videos per per-video Analytics report (API limit for dimensions=video)
+BATCH_MAX_VIDEOS = 200
+
+# Metrics requested for every stats query (also the keys of EMPTY_STATS)
+METRICS = "views,estimatedMinutesWatched,averageViewPercentage,likes,comments,shares,subscribersGained"
+
+# Stats returned for videos the API has no data for yet
+EMPTY_STATS = {
+    "views": 0,
+    "estimatedMinutesWatched": 0.0,
+    "averageViewPercentage": 0.0,
+    "likes": 0,
+    "comments": 0,
+    "shares": 0,
+    "subscribersGained": 0,
+}
+
+
+def _save_token(token_path: Path, content: str) -> None:
+    """Replace token.json atomically — the uploader reads the same file."""
+    tmp_path = token_path.with_name(f".{token_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(content)
+    os.replace(tmp_path, token_path)
+
+
+@lru_cache(maxsize=1)
+def _analytics_discovery_doc() -> Optional[str]:
+    """youtubeAnalytics v2 discovery document bundled with googleapiclient, read once."""
+    from googleapiclient.discovery_cache import get_static_doc
+
+    return get_static_doc("youtubeAnalytics", "v2")
+
 
 def get_youtube_analytics_service(credentials_dir: str = None):
     """Get authenticated YouTube Analytics API service.
 
+    The built service is reused per thread (httplib2 connections aren't
+    thread-safe) until token.json changes on disk or the credentials expire.
+
     Args:
         credentials_dir: Directory containing token.json (e.g. 'credentials/pl').
                          Defaults to the current tenant's credentials dir via ContextVar.
@@ -43,20 +113,48 @@ def get_youtube_analytics_service(credentials_dir: str = None):
             "Run scripts/refresh-yt-token.sh first."
         )
 
-    creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+    services = getattr(_thread_services, "by_dir", None)
+    if services is None:
+        services = _thread_services.by_dir = {}
+    cached = services.get(cdir)
+    if cached:
+        token_mtime, creds, service = cached
+        if token_mtime == token_path.stat().st_mtime_ns and creds.valid:
+            return service
+
+    # Google client stack is imported here, not at module level, so importing
+    # this module stays cheap for code paths that never hit the API
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.discovery import build, build_from_document
+
+    # One refresh at a time: threads that lost the race re-read the token the
+    # winner just saved instead of refreshing (and rewriting) it again.
+    with _token_lock:
+        creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+                _save_token(token_path, creds.to_json())
+            else:
+                raise RuntimeError(
+                    f"YouTube credentials expired. Delete {token_path} and run scripts/refresh-yt-token.sh"
+                )
 
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-            # Save refreshed token
-            with open(token_path, "w") as f:
-                f.write(creds.to_json())
-        else:
-            raise RuntimeError(
-                f"YouTube credentials expired. Delete {token_path} and run scripts/refresh-yt-token.sh"
-            )
+    doc = _analytics_discovery_doc()
+    if doc is not None:
+        service = build_from_document(doc, credentials=creds)
+    else:
+        service = build("youtubeAnalytics", "v2", credentials=creds, static_discovery=False)
+    services[cdir] = (token_path.stat().st_mtime_ns, creds, service)
+    return service
 
-    return build("youtubeAnalytics", "v2", credentials=creds)
+
+@lru_cache(maxsize=1)
+def _stats_date_window(today: date) -> tuple[str, str]:
+    """(startDate, endDate) for stats queries: the STATS_WINDOW up to today, computed once per day."""
+    return (today - STATS_WINDOW).isoformat(), today.isoformat()
 
 
 def fetch_video_stats(video_id: str, credentials_dir: str = None) -> dict:
@@ -73,18 +171,16 @@ def fetch_video_stats(video_id: str, credentials_dir: str = None) -> dict:
     logger.info("Fetching YouTube stats from API for video: %s", video_id)
     analytics = get_youtube_analytics_service(credentials_dir)
 
-    # Get stats from video publish date to today
     # Use a wide date range to capture all data
-    end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    start_date = (datetime.now(timezone.utc) - timedelta(days=365)).strftime("%Y-%m-%d")
+    start_date, end_date = _stats_date_window(datetime.now(timezone.utc).date())
 
     try:
         response = analytics.reports().query(
             ids="channel==MINE",
             startDate=start_date,
             endDate=end_date,
-            metrics="views,estimatedMinutesWatched,averageViewPercentage,likes,comments,shares,subscribersGained",
-            filters=f"video=={video_id}",
+            metrics=METRICS,
+            filters="video==" + video_id,
         ).execute()
         
         logger.debug("YouTube API raw response for %s: %s", video_id, response)
@@ -96,30 +192,131 @@ def fetch_video_stats(video_id: str, credentials_dir: str = None) -> dict:
     rows = response.get("rows", [])
     if not rows:
         logger.info("No stats rows returned from API for video: %s", video_id)
-        return {
-            "views": 0,
-            "estimatedMinutesWatched": 0.0,
-            "averageViewPercentage": 0.0,
-            "likes": 0,
-            "comments": 0,
-            "shares": 0,
-            "subscribersGained": 0,
-        }
-
-    # First row contains the aggregated stats
-    row = rows[0]
-    column_headers = response.get("columnHeaders", [])
-
-    stats = {}
-    for i, header in enumerate(column_headers):
-        name = header["name"]
-        value = row[i] if i < len(row) else 0
-        stats[name] = value
+        return dict(EMPTY_STATS)
+
+    # First row contains the aggregated stats, one value per column header
+    names = [h["name"] for h in response.get("columnHeaders", [])]
+    stats = dict(zip(names, rows[0]))
 
     logger.info("Parsed stats for %s: views=%s, likes=%s", video_id, stats.get('views'), stats.get('likes'))
     return stats
 
 
+def _stats_memo_key(run_id: str) -> str:
+    return f"yt_stats:{get_tenant_prefix()}:{run_id}"
+
+
+def _no_upload_key(run_id: str) -> str:
+    return f"no_upload:{get_tenant_prefix()}:{run_id}"
+
+
+def forget_missing_upload(run_id: str) -> None:
+    """Drop a run's cached "no upload" verdict (call after writing its yt_upload.json)."""
+    _no_upload_memo.delete(_no_upload_key(run_id))
+
+
+def _read_upload_video_id(run_storage, run_id: str) -> Optional[str]:
+    """The run's uploaded video_id, or None if it has none (remembered for NO_UPLOAD_TTL)."""
+    memo_key = _no_upload_key(run_id)
+    if _no_upload_memo.get(memo_key):
+        return None
+
+    content = run_storage.try_read_bytes("yt_upload.json")
+    video_id = orjson.loads(content).get("video_id") if content is not None else None
+    if not video_id:
+        _no_upload_memo.set(memo_key, True)
+        return None
+    return video_id
+
+
+def _read_fresh_cached_stats(run_storage, run_id: str, max_age_hours: Optional[int]) -> Optional[dict]:
+    """Return cached yt_stats.json for a run if present and fresh enough, else None."""
+    stats_path = "yt_stats.json"
+    memo_key = _stats_memo_key(run_id)
+
+    try:
+        cached = _stats_memo.get(memo_key)
+        if cached is None:
+            content = run_storage.try_read_bytes(stats_path)
+            if content is None:
+                return None
+            cached = orjson.loads(content)
+            _stats_memo.set(memo_key, cached)
+
+        # Check age if requested
+        if max_age_hours is not None:
+            fetched_at_str = cached.get("fetched_at")
+            if fetched_at_str:
+                fetched_at = datetime.fromisoformat(fetched_at_str)
+                # Handle timezone-naive vs timezone-aware
+                if fetched_at.tzinfo is None:
+                    fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+
+                age = datetime.now(timezone.utc) - fetched_at
+                if age < timedelta(hours=max_age_hours):
+                    logger.debug("Using cached stats for run %s (age: %s)", run_id, age)
+                    return cached
+                else:
+                    logger.info("Cached stats for %s are too old (%s hours), refreshing", run_id, age.total_seconds() / 3600)
+            else:
+                logger.info("Cached stats for %s have no timestamp, refreshing", run_id)
+        else:
+            logger.debug("Using cached stats for run %s (no max_age check)", run_id)
+            return cached
+    except Exception as e:
+        logger.debug("Error reading cached stats for %s: %s", run_id, e)
+
+    return None
+
+
+def fetch_video_stats_batch(video_ids: list[str], credentials_dir: str = None) -> dict[str, dict]:
+    """
+    Fetch statistics for many videos with one Analytics query per chunk.
+
+    Uses the per-video report (dimensions=video), which returns one row per
+    video for up to BATCH_MAX_VIDEOS ids at a time.
+
+    Returns:
+        Dict mapping video_id to the same stats dict fetch_video_stats returns.
+        Videos without any rows get zeroed stats.
+    """
+    if not video_ids:
+        return {}
+
+    logger.info("Fetching YouTube stats from API for %d videos (batched)", len(video_ids))
+    analytics = get_youtube_analytics_service(credentials_dir)
+
+    start_date, end_date = _stats_date_window(datetime.now(timezone.utc).date())
+
+    results: dict[str, dict] = {}
+    for i in range(0, len(video_ids), BATCH_MAX_VIDEOS):
+        chunk = video_ids[i:i + BATCH_MAX_VIDEOS]
+        try:
+            response = analytics.reports().query(
+                ids="channel==MINE",
+                startDate=start_date,
+                endDate=end_date,
+                metrics=METRICS,
+                dimensions="video",
+                filters="video==" + ",".join(chunk),
+                maxResults=len(chunk),
+                sort="-views",
+            ).execute()
+        except Exception as e:
+            logger.error("YouTube Analytics batch query failed (%d videos): %s", len(chunk), e)
+            raise
+
+        names = [h["name"] for h in response.get("columnHeaders", [])]
+        for row in response.get("rows", []):
+            stats = dict(zip(names, row))
+            results[stats.pop("video")] = stats
+
+    for video_id in video_ids:
+        results.setdefault(video_id, dict(EMPTY_STATS))
+
+    return results
+
+
 def get_or_fetch_stats(run_id: str, force: bool = False, max_age_hours: Optional[int] = None, credentials_dir: str = None) -> Optional[dict]:
     """
     Get cached stats or fetch fresh from YouTube Analytics API.
@@ -135,44 +332,17 @@ def get_or_fetch_stats(run_id: str, force: bool = False, max_age_hours: Optional
     run_storage = get_run_storage(run_id)
 
     # Check if this run has a YouTube upload
-    if not run_storage.exists("yt_upload.json"):
-        return None
-
-    yt_upload = json.loads(run_storage.read_text("yt_upload.json"))
-    video_id = yt_upload.get("video_id")
+    video_id = _read_upload_video_id(run_storage, run_id)
     if not video_id:
         return None
 
     stats_path = "yt_stats.json"
 
     # Check for cached stats
-    if not force and run_storage.exists(stats_path):
-        try:
-            cached = json.loads(run_storage.read_text(stats_path))
-            
-            # Check age if requested
-            if max_age_hours is not None:
-                fetched_at_str = cached.get("fetched_at")
-                if fetched_at_str:
-                    fetched_at = datetime.fromisoformat(fetched_at_str)
-                    # Handle timezone-naive vs timezone-aware
-                    if fetched_at.tzinfo is None:
-                        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
-                    
-                    age = datetime.now(timezone.utc) - fetched_at
-                    if age < timedelta(hours=max_age_hours):
-                        logger.debug("Using cached stats for run %s (age: %s)", run_id, age)
-                        return cached
-                    else:
-                        logger.info("Cached stats for %s are too old (%s hours), refreshing", run_id, age.total_seconds() / 3600)
-                else:
-                    logger.info("Cached stats for %s have no timestamp, refreshing", run_id)
-            else:
-                logger.debug("Using cached stats for run %s (no max_age check)", run_id)
-                return cached
-        except (json.JSONDecodeError, Exception) as e:
-            logger.debug("Error reading cached stats for %s: %s", run_id, e)
-            pass
+    if not force:
+        cached = _read_fresh_cached_stats(run_storage, run_id, max_age_hours)
+        if cached is not None:
+            return cached
 
     # Check if credentials exist before trying to fetch
     cdir = credentials_dir or get_credentials_dir()
@@ -195,7 +365,110 @@ def get_or_fetch_stats(run_id: str, force: bool = False, max_age_hours: Optional
     }
 
     # Cache the result
-    run_storage.write_text(stats_path, json.dumps(result, indent=2))
+    run_storage.write_bytes(stats_path, orjson.dumps(result))
+    _stats_memo.set(_stats_memo_key(run_id), result)
     logger.info("Successfully fetched and cached fresh stats for video %s in run %s", video_id, run_id)
 
     return result
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            _io_executor = ThreadPoolExecutor(
+                max_workers=BULK_IO_WORKERS, thread_name_prefix="yt-stats-io"
+            )
+        return _io_executor
+
+
+def _stale_video_id(run_id: str, force: bool, max_age_hours: Optional[int]) -> Optional[str]:
+    """Return the run's video_id if its stats need fetching, else None."""
+    run_storage = get_run_storage(run_id)
+    try:
+        video_id = _read_upload_video_id(run_storage, run_id)
+    except Exception as e:
+        logger.debug("Error reading upload info for %s: %s", run_id, e)
+        return None
+
+    if not video_id:
+        return None
+    if not force and _read_fresh_cached_stats(run_storage, run_id, max_age_hours) is not None:
+        return None
+    return video_id
+
+
+def _write_cached_stats(run_id: str, content: bytes) -> bool:
+    """Write a run's yt_stats.json. Failures are logged and skipped (returns False)."""
+    try:
+        get_run_storage(run_id).write_bytes("yt_stats.json", content)
+        return True
+    except Exception as e:
+        logger.warning("Failed to cache stats for run %s: %s", run_id, e)
+        return False
+
+
+def get_or_fetch_stats_bulk(
+    run_ids: list[str],
+    force: bool = False,
+    max_age_hours: Optional[int] = None,
+    credentials_dir: str = None,
+) -> dict[str, dict]:
+    """
+    Bulk variant of get_or_fetch_stats: refresh stale stats for many runs
+    with batched Analytics queries instead of one query per run.
+
+    Returns:
+        Dict mapping run_id to the freshly fetched result for runs that were
+        updated. Runs without uploads or with fresh cached stats are omitted.
+    """
+    executor = _get_io_executor()
+
+    # Per-run storage reads are independent round-trips (S3 HEAD/GET) — fan out
+    video_ids = map_in_tenant_context(
+        executor,
+        _stale_video_id,
+        run_ids,
+        [force] * len(run_ids),
+        [max_age_hours] * len(run_ids),
+    )
+    stale: dict[str, list[str]] = {}  # video_id -> run_ids
+    for run_id, video_id in zip(run_ids, video_ids):
+        if video_id:
+            stale.setdefault(video_id, []).append(run_id)
+
+    if not stale:
+        return {}
+
+    cdir = credentials_dir or get_credentials_dir()
+    token_path = _PROJECT_ROOT / cdir / "token.json"
+    if not token_path.exists():
+        logger.warning("YouTube token missing at %s, skipping stats fetch for %d runs", token_path, len(stale))
+        return {}
+
+    try:
+        stats_by_video = fetch_video_stats_batch(list(stale), credentials_dir=cdir)
+    except Exception as e:
+        logger.error("Failed to fetch batched stats for %d videos: %s", len(stale), e)
+        return {}
+
+    fetched_at = datetime.now(timezone.utc).isoformat()
+    updated: dict[str, dict] = {}
+    contents: dict[str, bytes] = {}
+    for video_id, stats in stats_by_video.items():
+        result = {"video_id": video_id, "fetched_at": fetched_at, "stats": stats}
+        content = orjson.dumps(result)  # serialized once, shared by every run of the video
+        for run_id in stale.get(video_id, []):
+            updated[run_id] = result
+            contents[run_id] = content
+
+    # A failed write only drops that run from the result; the rest still count
+    written = map_in_tenant_context(executor, _write_cached_stats, contents, contents.values())
+    for run_id, ok in zip(list(contents), written):
+        if ok:
+            _stats_memo.set(_stats_memo_key(run_id), updated[run_id])
+        else:
+            del updated[run_id]
+
+    logger.info("Fetched and cached fresh stats for %d runs (%d videos)", len(updated), len(stats_by_video))
+    return updated
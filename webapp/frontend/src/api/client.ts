@@ -868,6 +868,7 @@ export interface SchedulerConfig {
   generation_time: string;
   publish_time: string;
   runs: ScheduledRunConfig[];  // Per-run configurations
+  max_parallel_runs?: number;  // Runs generated concurrently per scheduled job
 }
 
 export interface SchedulerState {